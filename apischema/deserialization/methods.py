@@ -26,7 +26,7 @@ from apischema.validation.errors import (
     merge_errors,
 )
 from apischema.validation.mock import ValidatorMock
-from apischema.validation.validators import Validator, validate
+from apischema.validation.validators import Validator, _validate
 
 
 @dataclass
@@ -211,10 +211,18 @@ class ValidatorMethod(DeserializationMethod):
     method: DeserializationMethod
     validators: Sequence[Validator]
     aliaser: Aliaser
+    any_discard: bool = field(init=False)
+
+    def __post_init__(self):
+        self.any_discard = any(v.discard for v in self.validators)
 
     def deserialize(self, data: Any) -> Any:
-        return validate(
-            self.method.deserialize(data), self.validators, aliaser=self.aliaser
+        return _validate(
+            self.method.deserialize(data),
+            self.validators,
+            None,
+            self.aliaser,
+            self.any_discard,
         )
 
 
@@ -547,6 +555,7 @@ class ObjectMethod(DeserializationMethod):
     unexpected: str
     discriminator: Optional[str]
     aggregate_fields: bool = field(init=False)
+    any_discard: bool = field(init=False)
 
     def __post_init__(self):
         self.aggregate_fields = bool(
@@ -554,6 +563,7 @@ class ObjectMethod(DeserializationMethod):
             or self.pattern_fields
             or self.additional_field is not None
         )
+        self.any_discard = any(v.discard for v in self.validators)
 
     def deserialize(self, data: Any) -> Any:
         if not isinstance(data, dict):
@@ -690,17 +700,18 @@ class ObjectMethod(DeserializationMethod):
                         for v in validators
                         if v.dependencies.isdisjoint(invalid_fields)
                     ]
-                    validate(
+                    _validate(
                         ValidatorMock(self.constructor.cls, values),
                         valid_validators,
                         init,
-                        aliaser=self.aliaser,
+                        self.aliaser,
+                        self.any_discard,
                     )
                 except ValidationError as err:
                     error = merge_errors(error, err)
                 raise error
             obj = self.constructor.construct(values)
-            return validate(obj, validators, init, aliaser=self.aliaser)
+            return _validate(obj, validators, init, self.aliaser, self.any_discard)
         elif field_errors or errors:
             raise ValidationError(errors or [], field_errors or {})
         return self.constructor.construct(values)
@@ -1,4 +1,5 @@
 import inspect
+from types import SimpleNamespace
 from typing import (
     Any,
     Callable,
@@ -15,11 +16,39 @@ from typing import (
 from apischema.cache import cache
 from apischema.metadata import properties
 from apischema.objects.fields import ObjectField
-from apischema.objects.visitor import ObjectVisitor
+from apischema.objects.visitor import ObjectVisitor, override_fields
 from apischema.types import AnyType, OrderedDict
 from apischema.typing import _GenericAlias, get_type_hints
-from apischema.utils import empty_dict
-from apischema.visitor import Unsupported
+from apischema.utils import empty_dict, get_origin_or_type, is_dataclass
+from apischema.visitor import Unsupported, dataclass_types_and_fields
+
+
+class GetFields(ObjectVisitor[Sequence[ObjectField]]):
+    def __init__(
+        self,
+        deserialization: bool,
+        serialization: bool,
+        default: Optional[Callable[[type], Optional[Sequence[ObjectField]]]],
+    ):
+        super().__init__()
+        self.deserialization = deserialization
+        self.serialization = serialization
+        self.default = default
+
+    def _skip_field(self, field: ObjectField) -> bool:
+        return (field.skip.deserialization and self.serialization) or (
+            field.skip.serialization and self.deserialization
+        )
+
+    def _override_fields(
+        self, tp: AnyType, fields: Sequence[ObjectField]
+    ) -> Sequence[ObjectField]:
+        if self.default is None:
+            return fields
+        return override_fields(tp, fields, self.default)
+
+    def object(self, cls: Type, fields: Sequence[ObjectField]) -> Sequence[ObjectField]:
+        return fields
 
 
 @cache
@@ -31,45 +60,38 @@ def object_fields(
         Callable[[type], Optional[Sequence[ObjectField]]]
     ] = ObjectVisitor._default_fields,
 ) -> Mapping[str, ObjectField]:
-    class GetFields(ObjectVisitor[Sequence[ObjectField]]):
-        def _skip_field(self, field: ObjectField) -> bool:
-            return (field.skip.deserialization and serialization) or (
-                field.skip.serialization and deserialization
-            )
-
-        @staticmethod
-        def _default_fields(cls: type) -> Optional[Sequence[ObjectField]]:
-            return None if default is None else default(cls)
-
-        def object(
-            self, cls: Type, fields: Sequence[ObjectField]
-        ) -> Sequence[ObjectField]:
-            return fields
-
+    get_fields = GetFields(deserialization, serialization, default)
     try:
-        return OrderedDict((f.name, f) for f in GetFields().visit(tp))
+        # Dataclasses are the common case, call the visitor method directly instead
+        # of going through the whole visit dispatch
+        if is_dataclass(get_origin_or_type(tp)):
+            fields = get_fields.dataclass(tp, *dataclass_types_and_fields(tp))
+        else:
+            fields = get_fields.visit(tp)
+        return OrderedDict((f.name, f) for f in fields)
     except (Unsupported, NotImplementedError):
         raise TypeError(f"{tp} doesn't have fields")
 
 
-def object_fields2(obj: Any) -> Mapping[str, ObjectField]:
-    return object_fields(
-        obj if isinstance(obj, (type, _GenericAlias)) else obj.__class__
-    )
+def _object_type(obj: Any) -> AnyType:
+    return obj if isinstance(obj, (type, _GenericAlias)) else obj.__class__
 
 
 T = TypeVar("T")
 
 
-class FieldGetter:
-    def __init__(self, obj: Any):
-        self.fields = object_fields2(obj)
+class _FrozenNamespace(SimpleNamespace):
+    # Getters are cached and shared, so they must not be modified
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"cannot delete field {name!r}")
 
-    def __getattribute__(self, name: str) -> ObjectField:
-        try:
-            return object.__getattribute__(self, "fields")[name]
-        except KeyError:
-            raise AttributeError(name)
+
+@cache
+def _field_getter(cls: AnyType) -> SimpleNamespace:
+    return _FrozenNamespace(**object_fields(cls))
 
 
 @overload
@@ -85,22 +107,18 @@ def get_field(obj: T) -> T:
 # Overload because of Mypy issue
 # https://github.com/python/mypy/issues/9003#issuecomment-667418520
 def get_field(obj: Union[Type[T], T]) -> T:
-    return cast(T, FieldGetter(obj))
+    return cast(T, _field_getter(_object_type(obj)))
 
 
 class AliasedStr(str):
     pass
 
 
-class AliasGetter:
-    def __init__(self, obj: Any):
-        self.fields = object_fields2(obj)
-
-    def __getattribute__(self, name: str) -> str:
-        try:
-            return AliasedStr(object.__getattribute__(self, "fields")[name].alias)
-        except KeyError:
-            raise AttributeError(name)
+@cache
+def _alias_getter(cls: AnyType) -> SimpleNamespace:
+    return _FrozenNamespace(
+        **{name: AliasedStr(field.alias) for name, field in object_fields(cls).items()}
+    )
 
 
 @overload
@@ -114,7 +132,7 @@ def get_alias(obj: T) -> T:
 
 
 def get_alias(obj: Union[Type[T], T]) -> T:
-    return cast(T, AliasGetter(obj))
+    return cast(T, _alias_getter(_object_type(obj)))
 
 
 def parameters_as_fields(
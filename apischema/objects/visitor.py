@@ -1,5 +1,5 @@
 from dataclasses import MISSING, Field
-from typing import Any, Collection, Mapping, Optional, Sequence
+from typing import Any, Callable, Collection, Mapping, Optional, Sequence
 
 from apischema.aliases import Aliaser, get_class_aliaser
 from apischema.conversions.conversions import AnyConversion
@@ -44,6 +44,25 @@ def _override_alias(field: ObjectField, aliaser: Aliaser) -> ObjectField:
         return field
 
 
+def override_fields(
+    tp: AnyType,
+    fields: Sequence[ObjectField],
+    default: Callable[[type], Optional[Sequence[ObjectField]]],
+) -> Sequence[ObjectField]:
+    origin = get_origin_or_type(tp)
+    if isinstance(origin, type):
+        default_fields = default(origin)
+        if default_fields is not None:
+            if get_args(tp):
+                sub = dict(zip(get_parameters(origin), get_args(tp)))
+                default_fields = [
+                    replace(f, type=substitute_type_vars(f.type, sub))
+                    for f in default_fields
+                ]
+            return default_fields
+    return fields
+
+
 class ObjectVisitor(Visitor[Result]):
     _field_kind_filtered: Optional[FieldKind] = None
 
@@ -62,19 +81,7 @@ class ObjectVisitor(Visitor[Result]):
     def _override_fields(
         self, tp: AnyType, fields: Sequence[ObjectField]
     ) -> Sequence[ObjectField]:
-
-        origin = get_origin_or_type(tp)
-        if isinstance(origin, type):
-            default_fields = self._default_fields(origin)
-            if default_fields is not None:
-                if get_args(tp):
-                    sub = dict(zip(get_parameters(origin), get_args(tp)))
-                    default_fields = [
-                        replace(f, type=substitute_type_vars(f.type, sub))
-                        for f in default_fields
-                    ]
-                return default_fields
-        return fields
+        return override_fields(tp, fields, self._default_fields)
 
     def _object(self, tp: AnyType, fields: Sequence[ObjectField]) -> Result:
         fields = [f for f in fields if not self._skip_field(f)]
@@ -1,19 +1,26 @@
-from collections import defaultdict
 from functools import wraps
-from inspect import Parameter, isgeneratorfunction, signature
+from inspect import (
+    CO_GENERATOR,
+    CO_VARARGS,
+    CO_VARKEYWORDS,
+    Parameter,
+    isgeneratorfunction,
+    signature,
+)
 from itertools import chain
-from types import MethodType
+from types import FunctionType, MethodType
 from typing import (
     AbstractSet,
     Any,
     Callable,
     Collection,
+    Dict,
     Iterable,
     List,
     Mapping,
-    MutableMapping,
     Optional,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     overload,
@@ -36,13 +43,65 @@ from apischema.validation.errors import (
 )
 from apischema.validation.mock import NonTrivialDependency
 
-_validators: MutableMapping[Type, List["Validator"]] = CacheAwareDict(defaultdict(list))
+_validators: CacheAwareDict[Type, List["Validator"]] = CacheAwareDict({})
+
+
+# Plain dict instead of apischema.cache: cache.set_size rebinds cached functions,
+# so registration could not clear the ones already imported by other modules.
+# Whether one of the validators can discard fields is cached alongside.
+_validators_by_type: Dict[AnyType, Tuple[Sequence["Validator"], bool]] = {}
+
+
+def _type_validators(tp: AnyType) -> Tuple[Sequence["Validator"], bool]:
+    try:
+        return _validators_by_type[tp]
+    except KeyError:
+        validators = tuple(
+            chain.from_iterable(
+                _validators.get(cls, ()) for cls in getattr(tp, "__mro__", [tp])
+            )
+        )
+        result = _validators_by_type[tp] = (
+            validators,
+            any(v.discard for v in validators),
+        )
+        return result
 
 
 def get_validators(tp: AnyType) -> Sequence["Validator"]:
-    return list(
-        chain.from_iterable(_validators[cls] for cls in getattr(tp, "__mro__", [tp]))
-    )
+    return _type_validators(tp)[0]
+
+
+def _validator_params(func: Callable) -> AbstractSet[str]:
+    # Plain functions parameters are read from their code object, avoiding the
+    # overhead of signature; wrapped functions need signature to follow __wrapped__
+    if isinstance(func, FunctionType) and not hasattr(func, "__wrapped__"):
+        code = func.__code__
+        var_keyword, var_positional = (
+            bool(code.co_flags & CO_VARKEYWORDS),
+            bool(code.co_flags & CO_VARARGS),
+        )
+        param_count = code.co_argcount + code.co_kwonlyargcount
+        has_params = param_count or var_keyword or var_positional
+        param_names = code.co_varnames[1:param_count]
+    else:
+        try:
+            parameters = signature(func).parameters
+        except ValueError:
+            return frozenset()
+        has_params = bool(parameters)
+        var_keyword, var_positional = (
+            any(p.kind == kind for p in parameters.values())
+            for kind in (Parameter.VAR_KEYWORD, Parameter.VAR_POSITIONAL)
+        )
+        param_names = tuple(parameters)[1:]
+    if not has_params:
+        raise TypeError("Validator must have at least one parameter")
+    if var_keyword:
+        raise TypeError("Validator cannot have variadic keyword parameter")
+    if var_positional:
+        raise TypeError("Validator cannot have variadic positional parameter")
+    return frozenset(param_names)
 
 
 class Discard(Exception):
@@ -66,20 +125,17 @@ class Validator:
             self.discard: Optional[Collection[FieldOrName]] = (field,)
         else:
             self.discard = discard
-        self.dependencies: AbstractSet[str] = set()
-        try:
-            parameters = signature(func).parameters
-        except ValueError:
-            self.params: AbstractSet[str] = set()
+        # Field names are resolved and cached on first use, for the same reason
+        self._field_name: Optional[str] = None
+        self._discarded: Optional[AbstractSet[str]] = None
+        self.dependencies: AbstractSet[str] = frozenset()
+        self.params = _validator_params(func)
+        self._params = tuple(self.params)
+        if isinstance(func, FunctionType):
+            is_generator = bool(func.__code__.co_flags & CO_GENERATOR)
         else:
-            if not parameters:
-                raise TypeError("Validator must have at least one parameter")
-            if any(p.kind == Parameter.VAR_KEYWORD for p in parameters.values()):
-                raise TypeError("Validator cannot have variadic keyword parameter")
-            if any(p.kind == Parameter.VAR_POSITIONAL for p in parameters.values()):
-                raise TypeError("Validator cannot have variadic positional parameter")
-            self.params = set(list(parameters)[1:])
-        if isgeneratorfunction(func):
+            is_generator = isgeneratorfunction(func)
+        if is_generator:
 
             def validate(*args, **kwargs):
                 errors = list(func(*args, **kwargs))
@@ -91,6 +147,23 @@ class Validator:
         else:
             self.validate = func
 
+    def _error(self, err: ValidationError, aliaser: Aliaser) -> ValidationError:
+        err = apply_aliaser(err, aliaser)
+        if self.field is None:
+            return err
+        # Alias cannot be resolved in __set_name__ because owner fields are not yet
+        # initialized (dataclass decorator is applied after class creation)
+        if self._field_name is None:
+            self._field_name = get_field_name(self.field)
+        alias = getattr(get_alias(self.owner), self._field_name)
+        return ValidationError(children={aliaser(alias): err})
+
+    def _discarded_fields(self) -> AbstractSet[str]:
+        if self._discarded is None:
+            assert self.discard
+            self._discarded = frozenset(map(get_field_name, self.discard))
+        return self._discarded
+
     def __get__(self, instance, owner):
         return self if instance is None else MethodType(self.func, instance)
 
@@ -99,8 +172,13 @@ class Validator:
 
     def _register(self, owner: Type):
         self.owner = owner
-        self.dependencies = find_all_dependencies(owner, self.func) | self.params
-        _validators[owner].append(self)
+        self.dependencies = frozenset(
+            find_all_dependencies(owner, self.func) | self.params
+        )
+        # Registration only impacts get_validators, so the wrapped dict is used
+        # directly to not reset all the caches when a new owner is inserted
+        _validators.wrapped.setdefault(owner, []).append(self)
+        _validators_by_type.clear()
 
     def __set_name__(self, owner, name):
         self._register(owner)
@@ -118,40 +196,58 @@ def validate(
     aliaser: Aliaser = lambda s: s,
 ) -> T:
     if validators is None:
-        validators = get_validators(obj.__class__)
+        validators, any_discard = _type_validators(obj.__class__)
     else:
-        validators = list(validators)
+        if not isinstance(validators, (list, tuple)):
+            validators = list(validators)
+        any_discard = any(v.discard for v in validators)
+    return _validate(obj, validators, kwargs, aliaser, any_discard)
+
+
+def _validate(
+    obj: T,
+    validators: Sequence[Validator],
+    kwargs: Optional[Mapping[str, Any]],
+    aliaser: Aliaser,
+    any_discard: bool,
+) -> T:
+    # any_discard is precomputed by callers reusing the same validators
     error: Optional[ValidationError] = None
-    for i, validator in enumerate(validators):
-        try:
-            if not kwargs:
+    if not kwargs and not any_discard:
+        # Fast path: no parameters to dispatch and no discarding to handle
+        for validator in validators:
+            try:
                 validator.validate(obj)
-            elif validator.params == kwargs.keys():
-                validator.validate(obj, **kwargs)
-            else:
-                validator.validate(obj, **{k: kwargs[k] for k in validator.params})
-        except ValidationError as e:
-            err = apply_aliaser(e, aliaser)
-        except NonTrivialDependency as exc:
-            exc.validator = validator
-            raise
-        else:
-            continue
-        if validator.field is not None:
-            alias = getattr(get_alias(validator.owner), get_field_name(validator.field))
-            err = ValidationError(children={aliaser(alias): err})
-        error = merge_errors(error, err)
-        if validator.discard:
+            except ValidationError as err:
+                error = merge_errors(error, validator._error(err, aliaser))
+            except NonTrivialDependency as exc:
+                exc.validator = validator
+                raise
+    else:
+        i = 0
+        while i < len(validators):
+            validator = validators[i]
+            i += 1
             try:
-                discarded = set(map(get_field_name, validator.discard))
-                next_validators = (
-                    v for v in validators[i:] if v.dependencies.isdisjoint(discarded)
-                )
-                validate(obj, next_validators, kwargs, aliaser=aliaser)
+                if not kwargs or not validator._params:
+                    validator.validate(obj)
+                elif validator.params == kwargs.keys():
+                    validator.validate(obj, **kwargs)
+                else:
+                    validator.validate(obj, **{k: kwargs[k] for k in validator._params})
             except ValidationError as err:
-                raise merge_errors(error, err)
-            else:
-                raise error
+                error = merge_errors(error, validator._error(err, aliaser))
+                if validator.discard:
+                    discarded = validator._discarded_fields()
+                    validators = [
+                        v
+                        for v in validators[i:]
+                        if v.dependencies.isdisjoint(discarded)
+                    ]
+                    i = 0
+            except NonTrivialDependency as exc:
+                exc.validator = validator
+                raise
     if error is not None:
         raise error
     return obj
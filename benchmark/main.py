@@ -1,9 +1,15 @@
+import argparse
 import importlib.metadata
+import io
 import json
+import multiprocessing
+import os
 import pathlib
 import time
 import timeit
-from collections.abc import Callable, Collection, Mapping, Sequence
+from collections.abc import Callable, Collection, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from dataclasses import dataclass, replace
 from typing import Any, NamedTuple
 
@@ -28,8 +34,10 @@ packages = [
 
 def time_it(func: Callable, arg: Any) -> float:
     timer = timeit.Timer(lambda: func(arg))
-    number, _ = timer.autorange()
-    return min(timer.repeat(number=number)) / number
+    number, autorange_time = timer.autorange()
+    # Last autorange measure is a valid sample, reuse it as the fifth one
+    samples = [autorange_time, *timer.repeat(repeat=4, number=number)]
+    return min(samples) / number
 
 
 def time_it_mean(func: Callable, args: Collection) -> float:
@@ -94,14 +102,13 @@ def run_library_benchmark(
     module = importlib.import_module(f"{benchmarks.__name__}.{package}")
     end_import = time.perf_counter_ns()
     startup_time = (end_import - start_import) * 1e-9
+    # Benchmark lookup is done after end_import, so it is not part of startup_time
     simple_methods, complex_methods, library = next(
         val for val in module.__dict__.values() if isinstance(val, Benchmark)
     )
     library = library or package
-    simple_results, complex_results = [
-        run_benchmark(methods, data, key)
-        for methods, key in [(simple_methods, "simple"), (complex_methods, "complex")]
-    ]
+    simple_results = run_benchmark(simple_methods, data, "simple")
+    complex_results = run_benchmark(complex_methods, data, "complex")
     print(
         f"startup time: {startup_time + simple_results.first_run + complex_results.first_run}"
     )
@@ -166,13 +173,64 @@ def export_chart(
     plt.savefig(str(path), transparent=True)
 
 
+def run_library_benchmark_captured(
+    package: str, data: Mapping[str, Any]
+) -> tuple[str, LibraryBenchmarkResult]:
+    # Output is captured to be printed by the parent process, otherwise parallel
+    # benchmarks logs would be interleaved
+    with io.StringIO() as output, redirect_stdout(output):
+        result = run_library_benchmark(package, data)
+        return output.getvalue(), result
+
+
+def pin_worker(cores: multiprocessing.Queue):
+    os.sched_setaffinity(0, {cores.get()})
+
+
+def run_parallel_benchmarks(
+    data: Mapping[str, Any]
+) -> Iterator[LibraryBenchmarkResult]:
+    executor_kwargs: dict[str, Any] = {}
+    # CPU affinity is only available on some platforms, e.g. Linux
+    if hasattr(os, "sched_setaffinity"):
+        cores = sorted(os.sched_getaffinity(0))
+        worker_cores: multiprocessing.Queue = multiprocessing.Queue()
+        for core in cores:
+            worker_cores.put(core)
+        # Each worker is pinned to its own core, so there is at most one benchmark
+        # running by core
+        executor_kwargs.update(initializer=pin_worker, initargs=(worker_cores,))
+        cpu_count = len(cores)
+    else:
+        cpu_count = os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=min(len(packages), cpu_count), **executor_kwargs
+    ) as executor:
+        futures = [
+            executor.submit(run_library_benchmark_captured, p, data) for p in packages
+        ]
+        for future in futures:
+            output, result = future.result()
+            print(output, end="")
+            yield result
+
+
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="run libraries benchmarks in parallel processes; faster, but measures "
+        "can be skewed by shared CPU resources, so published results are sequential",
+    )
+    args = parser.parse_args()
     with open(DATA_PATH) as json_file:
         data = json.load(json_file)
-    results = sorted(
-        (run_library_benchmark(p, data) for p in packages),
-        key=LibraryBenchmarkResult.total,
-    )
+    if args.parallel:
+        library_results = run_parallel_benchmarks(data)
+    else:
+        library_results = (run_library_benchmark(p, data) for p in packages)
+    results = sorted(library_results, key=LibraryBenchmarkResult.total)
     relative_results = [res.relative(results[0]) for res in results]
     export_table(relative_results)
     export_chart(relative_results, LIGHT_CHART_PATH, "default")
@@ -0,0 +1,88 @@
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+import pytest
+
+from apischema import alias, settings
+from apischema.objects import (
+    AliasedStr,
+    ObjectField,
+    get_alias,
+    get_field,
+    object_fields,
+    set_object_fields,
+)
+from apischema.objects.getters import GetFields
+from apischema.objects.visitor import ObjectVisitor
+
+T = TypeVar("T")
+
+
+@dataclass
+class Data:
+    a: int
+    b: int = field(metadata=alias("c"))
+
+
+def test_get_field():
+    assert get_field(Data).a is object_fields(Data)["a"]
+    assert get_field(Data(0, 0)).b is object_fields(Data)["b"]
+    with pytest.raises(AttributeError):
+        get_field(Data).c
+
+
+def test_get_alias():
+    assert get_alias(Data).a == "a"
+    assert get_alias(Data(0, 0)).b == "c"
+    assert isinstance(get_alias(Data).b, AliasedStr)
+    with pytest.raises(AttributeError):
+        get_alias(Data).c
+
+
+@pytest.mark.parametrize("getter", [get_field, get_alias])
+def test_getters_are_frozen(getter):
+    with pytest.raises(AttributeError):
+        getter(Data).a = "oops"
+    with pytest.raises(AttributeError):
+        del getter(Data).a
+    assert getter(Data).a == getter(Data(0, 0)).a
+
+
+@dataclass
+class GenericData(Generic[T]):
+    a: T
+    b: int = field(default=0, metadata=alias("c"))
+
+
+@dataclass
+class Overridden:
+    a: int
+
+
+def visited_fields(tp, default=ObjectVisitor._default_fields):
+    fields = GetFields(False, False, default).visit(tp)
+    return {f.name: f for f in fields}
+
+
+@pytest.mark.parametrize("tp", [Data, GenericData, GenericData[str]])
+def test_dataclass_shortcut_matches_visit(tp):
+    assert dict(object_fields(tp)) == visited_fields(tp)
+    assert dict(object_fields(tp, default=None)) == visited_fields(tp, None)
+
+
+def test_dataclass_shortcut_matches_visit_with_overridden_fields(monkeypatch):
+    set_object_fields(Overridden, [ObjectField("b", str)])
+    try:
+        assert list(object_fields(Overridden)) == ["b"]
+        assert dict(object_fields(Overridden)) == visited_fields(Overridden)
+        assert list(object_fields(Overridden, default=None)) == ["a"]
+    finally:
+        set_object_fields(Overridden, None)
+
+    def default_object_fields(cls):
+        return [ObjectField("c", T)] if cls is GenericData else None
+
+    monkeypatch.setattr(settings, "default_object_fields", default_object_fields)
+    fields = object_fields(GenericData[int])
+    assert fields["c"].type is int
+    assert dict(fields) == visited_fields(GenericData[int])
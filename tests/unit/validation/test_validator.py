@@ -1,8 +1,12 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import wraps
 from typing import Callable, Type
 
 import pytest
 
+import apischema.cache
+import apischema.deserialization
 from apischema import ValidationError, validator
 from apischema.validation.mock import NonTrivialDependency, ValidatorMock
 from apischema.validation.validators import Validator, get_validators, validate
@@ -38,9 +42,49 @@ def get_validators_by_method(cls: Type, method: Callable) -> Validator:
 
 
 def test_get_validators():
-    assert get_validators(Data) == [
+    assert get_validators(Data) == tuple(
         get_validators_by_method(Data, method)
         for method in (Data.a_gt_10, Data.a_lt_100, Data.non_trivial)
+    )
+
+
+def test_get_validators_registered_later():
+    @dataclass
+    class Late:
+        a: int
+
+    assert get_validators(Late) == ()
+
+    def a_positive(late: Late):
+        assert late.a > 0
+
+    validator(a_positive)
+    assert [v.func for v in get_validators(Late)] == [a_positive]
+
+
+@pytest.fixture
+def restore_cache_size():
+    cached = list(apischema.cache._cached)
+    yield
+    for func in cached:
+        wrapped = func.__wrapped__
+        setattr(sys.modules[wrapped.__module__], wrapped.__name__, func)
+
+
+def test_get_validators_registered_after_set_size(restore_cache_size):
+    @dataclass
+    class Late:
+        a: int
+
+    assert apischema.deserialization.get_validators(Late) == ()
+    apischema.cache.set_size(100)
+
+    def a_positive(late: Late):
+        assert late.a > 0
+
+    validator(a_positive)
+    assert [v.func for v in apischema.deserialization.get_validators(Late)] == [
+        a_positive
     ]
 
 
@@ -71,3 +115,65 @@ def test_non_trivial():
     # err.value.attr != "c" because `c` has a default value
     assert err.value.attr == "b"
     assert err.value.validator.func == Data.non_trivial
+
+
+def test_validator_params():
+    def with_params(data: Data, a, *, b):
+        ...
+
+    assert Validator(with_params).params == {"a", "b"}
+    assert Validator(wraps(with_params)(lambda *args, **kwargs: ...)).params == {
+        "a",
+        "b",
+    }
+    for func, msg in [
+        (lambda: ..., "at least one parameter"),
+        (lambda data, **kwargs: ..., "variadic keyword"),
+        (lambda *args: ..., "variadic positional"),
+    ]:
+        with pytest.raises(TypeError, match=msg):
+            Validator(func)
+
+
+def test_validate_kwargs():
+    calls = []
+
+    def no_params(data: Data):
+        calls.append(())
+
+    def a_param(data: Data, a):
+        calls.append((a,))
+
+    def all_params(data: Data, a, b):
+        calls.append((a, b))
+
+    data, kwargs = Data(42, 0), {"a": 0, "b": 1}
+    validate(data, [Validator(all_params)], kwargs)
+    assert calls == [(0, 1)]
+    calls.clear()
+    validate(data, map(Validator, (no_params, a_param, all_params)), kwargs)
+    assert calls == [(), (0,), (0, 1)]
+
+
+@dataclass
+class Discarding:
+    a: int
+    b: int = field()
+
+    @validator(discard=b)
+    def discard_b(self):
+        raise ValidationError("discard")
+
+    @validator
+    def uses_b(self):
+        raise ValidationError(str(self.b))
+
+    @validator
+    def uses_a(self):
+        raise ValidationError(str(self.a))
+
+
+def test_validate_discard():
+    with pytest.raises(ValidationError) as err:
+        validate(Discarding(0, 1))
+    assert err.value.messages == ["discard", "0"]